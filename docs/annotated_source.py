@@ -0,0 +1,679 @@
+# Import the tkinter module for creating graphical user interfaces (GUIs)
+# We alias it as "tk" to simplify subsequent references to its classes and methods.
+import tkinter as tk
+
+# Import the scrolledtext widget from tkinter. This widget is a text area with a built-in scrollbar,
+# which is useful for displaying long logs or messages that might exceed the visible area.
+from tkinter import scrolledtext
+
+# Import the threading module to enable concurrent execution of code.
+# This allows us to run the updater in the background without freezing the GUI.
+import threading
+
+# Import the time module to access time-related functions.
+# We use it to turn the moment a log record was created into a human-readable timestamp,
+# and to schedule updates with a monotonic clock.
+import time
+
+# Import the json module to read and write the small resolver cache file.
+import json
+
+# Import the ipaddress module to check that the public IP lookup really returned an IP address.
+import ipaddress
+
+# Import the os module to build the cache file path and create its folder.
+import os
+
+# Import the socket module. Its getaddrinfo function is what turns host names into IP addresses.
+import socket
+
+# Import the sys module to check which operating system the program is running on.
+import sys
+
+# Import the logging module and its handlers submodule. logging timestamps and formats messages,
+# and its QueueHandler lets background threads hand log records to the GUI thread through a queue.
+import logging
+import logging.handlers
+
+# Import the queue module which provides a thread-safe queue.
+# This is useful for passing log messages from the background thread to the main GUI thread.
+import queue
+
+# Import the quote function, which escapes text so it can be safely placed inside a URL.
+from urllib.parse import quote
+
+
+# Define a small Formatter subclass used to render log records in the GUI.
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    A logging Formatter that reuses the timestamp string for records logged within the same second.
+    Bursts of messages usually share the same second, so the time is only formatted once per burst.
+    """
+    def __init__(self, fmt, datefmt):
+        # Let the base Formatter store the message format and the date format.
+        super().__init__(fmt, datefmt)
+        # The second (as a whole number since the epoch) of the last formatted timestamp.
+        self._cached_second = None
+        # The formatted timestamp string for that second.
+        self._cached_time = ""
+
+    def formatTime(self, record, datefmt=None):
+        # record.created is the time.time() value captured when the message was logged,
+        # so the background thread never has to format any dates itself.
+        second = int(record.created)
+        # Only format a new timestamp when the record falls in a different second than the last one.
+        if second != self._cached_second:
+            self._cached_second = second
+            # time.localtime() + time.strftime() avoid allocating a datetime object.
+            self._cached_time = time.strftime(self.datefmt, time.localtime(second))
+        # Return the (possibly cached) timestamp string.
+        return self._cached_time
+
+
+# Define a QueueHandler subclass that tells the GUI when a new log record is waiting.
+class _NotifyingQueueHandler(logging.handlers.QueueHandler):
+    """
+    A QueueHandler that, after putting a record into the queue, wakes up the Tkinter main loop
+    by generating a virtual event. The GUI then only does work when there is something to show.
+    """
+    def __init__(self, log_queue, widget):
+        # Let the base QueueHandler store the queue the records are placed into.
+        super().__init__(log_queue)
+        # The Tkinter widget that receives the virtual event (the main window).
+        self.widget = widget
+
+    def handle(self, record):
+        # Let the base class filter the record and put it into the queue as usual.
+        # It does this while holding the handler's lock, and releases the lock before returning.
+        rv = super().handle(record)
+
+        # Only notify the GUI once that lock has been released. When called from the background
+        # thread, event_generate waits until the GUI thread's main loop has run it. If the lock were
+        # still held at that point and the GUI thread tried to log a message at the same moment,
+        # it would wait for the lock forever and never get back to the main loop: both threads would hang.
+        if rv:
+            try:
+                # Inject a "<<LogReady>>" event into the Tkinter event queue. when="tail" appends it
+                # after any events already waiting, so it is handled in order on the GUI thread.
+                self.widget.event_generate("<<LogReady>>", when="tail")
+            except (tk.TclError, RuntimeError):
+                # The window is gone or not yet in its main loop; the heartbeat will pick it up.
+                pass
+        return rv
+
+
+# ---------------------------
+# Resolver cache
+# ---------------------------
+
+# Every fresh start of the program would normally have to look up the IP address of DuckDNS
+# (a DNS query) before the first update. We remember that address in a small file next to the
+# user's application data, so the next start can connect straight away.
+
+# The host name whose address is cached.
+_DUCKDNS_HOST = "www.duckdns.org"
+
+# How long (in seconds) a cached address is trusted before it is looked up again.
+_RESOLVER_TTL = 3600
+
+# Where the cache is stored: %APPDATA%\duckdns\resolver.json on Windows.
+# When APPDATA is not set (e.g. on other platforms) this is None and the cache is simply not used,
+# rather than creating an unexpected folder somewhere else.
+_RESOLVER_CACHE = os.path.join(os.environ["APPDATA"], "duckdns", "resolver.json") if os.environ.get("APPDATA") else None
+
+# Keep a reference to the real getaddrinfo so it can be restored and still used for other hosts.
+_original_getaddrinfo = socket.getaddrinfo
+
+
+def _cached_getaddrinfo_for(ip, expires):
+    """
+    Returns a replacement for socket.getaddrinfo that answers the DuckDNS host with the cached address
+    until the entry expires.
+    """
+    def getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+        # The expiry is checked on every lookup, not just at startup, because the program may run
+        # for days. Once the entry has expired, the DuckDNS host is resolved normally again.
+        if host == _DUCKDNS_HOST and time.time() < expires:
+            # Pass the cached numeric address to the real getaddrinfo. AI_NUMERICHOST guarantees
+            # that no DNS query is made, while still returning correctly shaped address tuples.
+            return _original_getaddrinfo(ip, port, family, type, proto, flags | socket.AI_NUMERICHOST)
+        # Any other host (or an expired entry) is resolved normally.
+        return _original_getaddrinfo(host, port, family, type, proto, flags)
+    return getaddrinfo
+
+
+def load_resolver_cache():
+    """
+    Reads the resolver cache file and, if its entry is still fresh, makes the DuckDNS host
+    resolve to the cached address without a DNS lookup.
+    """
+    # Without a cache location there is nothing to load.
+    if _RESOLVER_CACHE is None:
+        return
+    try:
+        # Read the cache entry written by a previous run.
+        with open(_RESOLVER_CACHE) as f:
+            entry = json.load(f)
+        # Read the expiry time as a number.
+        expires = float(entry["expires"])
+        # Ignore the entry if it is for a different host or has expired.
+        if entry["host"] != _DUCKDNS_HOST or expires <= time.time():
+            return
+        ip = entry["ip"]
+    except (OSError, ValueError, KeyError, TypeError):
+        # A missing, unreadable or malformed cache file simply means normal DNS lookups are used.
+        return
+    # Install the replacement getaddrinfo that serves the cached address until it expires.
+    socket.getaddrinfo = _cached_getaddrinfo_for(ip, expires)
+
+
+def save_resolver_cache(ip):
+    """
+    Writes the address that the DuckDNS connection actually used to the cache file, with a fresh
+    expiry time, for the next start. No extra DNS lookup is needed to do this.
+    """
+    # Without a cache location there is nowhere to save to.
+    if _RESOLVER_CACHE is None:
+        return
+    try:
+        # Make sure the cache folder exists, then write the entry with its expiry time.
+        os.makedirs(os.path.dirname(_RESOLVER_CACHE), exist_ok=True)
+        with open(_RESOLVER_CACHE, "w") as f:
+            json.dump({"host": _DUCKDNS_HOST, "ip": ip, "expires": time.time() + _RESOLVER_TTL}, f)
+    except OSError:
+        # The cache is only an optimization; failing to write it is harmless.
+        pass
+
+
+def drop_resolver_cache():
+    """
+    Stops using the cached address and deletes the cache file, for example after a failed DuckDNS
+    request, in case DuckDNS has moved to a different address.
+    """
+    # Restore normal DNS lookups.
+    socket.getaddrinfo = _original_getaddrinfo
+    # Without a cache location there is no file to delete.
+    if _RESOLVER_CACHE is None:
+        return
+    try:
+        os.remove(_RESOLVER_CACHE)
+    except OSError:
+        # The file may not exist; nothing to do in that case.
+        pass
+
+
+# Define a class called DuckDNSUpdater which encapsulates all functionality of our updater application.
+class DuckDNSUpdater:
+    # The __init__ method initializes the instance and sets up the GUI elements.
+    def __init__(self, master):
+        # Save the root Tkinter window (master) so we can add widgets and control the window.
+        self.master = master
+        # Set the title of the window to "DuckDNS Updater" to inform the user of the application’s purpose.
+        self.master.title("DuckDNS Updater")
+
+        # ---------------------------
+        # Create GUI components below
+        # ---------------------------
+
+        # Create and place a Label widget that prompts the user for the DuckDNS subdomain(s).
+        # Several subdomains can be entered, separated by commas.
+        # The grid() method is used to position the widget in the window layout.
+        tk.Label(master, text="DuckDNS Subdomain(s):").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
+
+        # Create a StringVar that always holds the current text of the subdomain field.
+        # Reading the variable is cheaper than asking the Entry widget for its contents.
+        self.subdomain_var = tk.StringVar(master)
+
+        # Create an Entry widget for the user to input the DuckDNS subdomain.
+        # 'width=30' specifies the number of characters the entry box can display, and
+        # 'textvariable' links the field to the StringVar created above.
+        self.subdomain_entry = tk.Entry(master, width=30, textvariable=self.subdomain_var)
+        # Place the entry widget next to the label using grid() layout.
+        self.subdomain_entry.grid(row=0, column=1, padx=5, pady=5)
+
+        # Create and place a Label widget prompting the user for the DuckDNS token.
+        tk.Label(master, text="DuckDNS Token:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
+
+        # Create a StringVar that holds the current text of the token field.
+        self.token_var = tk.StringVar(master)
+
+        # Create an Entry widget for the token, with the 'show' parameter set to "*" to mask the token input.
+        self.token_entry = tk.Entry(master, width=30, show="*", textvariable=self.token_var)
+        # Place the token entry widget in the grid layout.
+        self.token_entry.grid(row=1, column=1, padx=5, pady=5)
+
+        # Create and place a Label widget asking for the update interval in minutes.
+        tk.Label(master, text="Update Interval (minutes):").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
+
+        # Register a validation function with Tkinter. "%P" passes the text the field *would* contain
+        # if the keystroke were accepted, so the function can reject anything that is not a number.
+        vcmd = (master.register(self._is_interval_text), "%P")
+
+        # Create a StringVar that holds the current text of the interval field.
+        self.interval_var = tk.StringVar(master)
+
+        # Create an Entry widget for the update interval, linked to its StringVar.
+        # validate="key" runs the validation function on every keystroke, so only digits and a
+        # single decimal point can ever be entered.
+        self.interval_entry = tk.Entry(master, width=30, textvariable=self.interval_var,
+                                       validate="key", validatecommand=vcmd)
+        # Place the update interval entry widget in the grid layout.
+        self.interval_entry.grid(row=2, column=1, padx=5, pady=5)
+
+        # ---------------------------
+        # Create control buttons below
+        # ---------------------------
+
+        # Create a Start button that, when clicked, triggers the start_updater method.
+        self.start_button = tk.Button(master, text="Start", command=self.start_updater)
+        # Place the Start button on the grid.
+        self.start_button.grid(row=3, column=0, padx=5, pady=5)
+
+        # Create a Stop button that triggers the stop_updater method.
+        # Initially, the Stop button is disabled (state=tk.DISABLED) because the updater is not running.
+        self.stop_button = tk.Button(master, text="Stop", command=self.stop_updater, state=tk.DISABLED)
+        # Place the Stop button on the grid.
+        self.stop_button.grid(row=3, column=1, padx=5, pady=5)
+
+        # ---------------------------
+        # Create log display area below
+        # ---------------------------
+
+        # Create a scrolled text widget to display log messages.
+        # 'width=50' and 'height=10' set the dimensions, and 'state=disabled' prevents user edits.
+        self.log_text = scrolledtext.ScrolledText(master, width=50, height=10, state='disabled')
+        # Place the log widget so that it spans two columns (covering both the labels and entries).
+        self.log_text.grid(row=4, column=0, columnspan=2, padx=5, pady=5)
+
+        # ---------------------------
+        # Initialize threading components
+        # ---------------------------
+
+        # This variable will hold our updater thread once it is created.
+        self.updater_thread = None
+
+        # Create a threading.Event object which acts as a flag for stopping the background updater thread.
+        self.stop_event = threading.Event()
+
+        # ---------------------------
+        # Initialize networking components
+        # ---------------------------
+
+        # Remember the public IP address that DuckDNS last accepted. While the current public IP
+        # matches it, there is nothing to update and the request to DuckDNS can be skipped.
+        self._last_ip = None
+
+        # Create a thread-safe queue for log records. This allows the background thread to safely send
+        # log messages to the main thread where they are displayed.
+        self.log_queue = queue.Queue()
+
+        # Create a QueueHandler: every record logged through it is placed into log_queue,
+        # and the main window is notified that a new record is waiting.
+        self._qh = _NotifyingQueueHandler(self.log_queue, self.master)
+        # Get a dedicated logger for the application and attach the queue handler to it.
+        self._logger = logging.getLogger("duckdns")
+        self._logger.addHandler(self._qh)
+        # Only INFO and above are recorded; lower-level messages are discarded before any formatting.
+        self._logger.setLevel(logging.INFO)
+        # Do not pass records on to the root logger, so nothing is printed twice.
+        self._logger.propagate = False
+
+        # Create a single Formatter, reused for every record, that prefixes each message with a timestamp.
+        # It is only ever used on the GUI thread, when the queued records are displayed.
+        self._formatter = _CachedTimeFormatter("[%(asctime)s] %(message)s", "%Y-%m-%d %H:%M:%S")
+
+        # Display queued records as soon as the "<<LogReady>>" virtual event arrives.
+        self.master.bind("<<LogReady>>", lambda e: self.process_log_queue())
+
+        # Also schedule the process_log_queue method to run after one second as a slow "heartbeat".
+        # This is only a safety net in case an event is ever missed; the id is kept so the
+        # pending heartbeat can be replaced instead of piling up.
+        self._heartbeat_id = self.master.after(1000, self.process_log_queue)
+
+    # ---------------------------
+    # Logging methods
+    # ---------------------------
+    def process_log_queue(self):
+        """
+        Checks the log queue for new log records and updates the log widget.
+        This method runs whenever a "<<LogReady>>" event arrives, and once a second as a heartbeat.
+        """
+        # Cancel the pending heartbeat; a fresh one is scheduled at the end of this method.
+        self.master.after_cancel(self._heartbeat_id)
+
+        # Look up the methods used for every record once and keep them in local variables.
+        # Reading a local variable is faster in Python than looking up an attribute on each use.
+        get = self.log_queue.get_nowait
+        fmt = self._formatter.format
+
+        # Collect every message currently waiting in the queue into a local list first.
+        lines = []
+        append = lines.append
+        try:
+            # Drain all messages currently in the queue.
+            while True:
+                # Retrieve a log record without blocking, format it with its timestamp,
+                # and add it to the batch as one line.
+                append(fmt(get()) + "\n")
+        except queue.Empty:
+            # If the queue is empty, a queue.Empty exception is raised; simply pass and continue.
+            pass
+
+        # Only touch the widget if there is something new to show. Each widget call crosses
+        # into Tcl, so the whole batch is written with a single insert instead of one per message.
+        if lines:
+            # Keep the widget and the END index in local variables as well.
+            log_text = self.log_text
+            END = tk.END
+            # Enable the log widget to allow text insertion.
+            log_text.configure(state='normal')
+            # Insert all collected log messages at the end of the text widget at once.
+            log_text.insert(END, "".join(lines))
+            # Disable the widget again to prevent user edits.
+            log_text.configure(state='disabled')
+            # Automatically scroll to the bottom so the latest log is visible.
+            log_text.yview(END)
+
+        # Reschedule the heartbeat to run again after one second.
+        self._heartbeat_id = self.master.after(1000, self.process_log_queue)
+
+    # ---------------------------
+    # Control methods to start and stop the updater
+    # ---------------------------
+    @staticmethod
+    def _is_interval_text(text):
+        """
+        Validation function for the interval Entry widget.
+        Accepts an empty field or digits with at most one decimal point, such as "5" or "2.5".
+        Zero can still be typed here (e.g. on the way to "0.5"); start_updater rejects it.
+        """
+        # Removing at most one "." must leave only decimal digits (or nothing at all).
+        return text == "" or text.replace(".", "", 1).isdecimal()
+
+    def start_updater(self):
+        """
+        Validates user input and starts the updater thread.
+        The updater thread will run in the background and send periodic update requests.
+        """
+        # Retrieve the subdomain and token input fields, reading them through their StringVars.
+        # The subdomain field may hold several comma-separated subdomains (e.g. "home, office"):
+        # split them apart, strip extra whitespace from each, and drop empty entries.
+        subdomains = [s.strip() for s in self.subdomain_var.get().split(",") if s.strip()]
+        # Strip any extra whitespace from the token.
+        token = self.token_var.get().strip()
+
+        # Retrieve the update interval. Thanks to the validation function the field can only
+        # contain a number, so it can be converted to a float (representing minutes) directly.
+        # An empty field is treated as zero.
+        text = self.interval_var.get().strip()
+        interval_minutes = float(text) if text else 0.0
+
+        # The interval must be greater than zero: with a zero interval the updater would send
+        # requests back to back without ever waiting.
+        if interval_minutes <= 0:
+            # If no valid interval was entered, log an error message and exit the method.
+            self._logger.info("Invalid interval. Interval must be greater than zero.")
+            return
+
+        # Check if the subdomain or token fields are empty.
+        if not subdomains or not token:
+            # Log an error message if either field is missing.
+            self._logger.info("Both subdomain and token are required!")
+            return
+
+        # Clear the stop event flag in case it was set previously (i.e., if restarting).
+        self.stop_event.clear()
+
+        # Forget the last updated IP, since the subdomain or token may have changed since the last run.
+        self._last_ip = None
+
+        # Disable the Start button to prevent starting multiple threads,
+        # and enable the Stop button so the user can stop the updater if needed.
+        self.start_button.config(state=tk.DISABLED)
+        self.stop_button.config(state=tk.NORMAL)
+
+        # Create a new thread to run the updater functionality.
+        # The thread is marked as daemon so it will exit when the main program exits.
+        self.updater_thread = threading.Thread(
+            target=self.run_updater,                     # The function to run in the background.
+            args=(subdomains, token, interval_minutes),  # Arguments to pass to the function.
+            daemon=True                                  # Daemon thread: stops automatically on exit.
+        )
+        # Start the background updater thread.
+        self.updater_thread.start()
+
+        # Log that the updater has started.
+        self._logger.info("Updater started.")
+
+    def stop_updater(self):
+        """
+        Signals the background updater thread to stop and updates the GUI buttons accordingly.
+        """
+        # Set the stop event flag which signals the thread to stop execution.
+        self.stop_event.set()
+
+        # Put the Start and Stop buttons back into their "not running" state.
+        self._reset_buttons()
+
+        # Log that the updater has been stopped.
+        self._logger.info("Updater stopped.")
+
+    def _reset_buttons(self):
+        """
+        Puts the GUI buttons back into their "not running" state.
+        Used when the updater is stopped, and when it could not be started at all.
+        """
+        # Re-enable the Start button to allow restarting the updater,
+        # and disable the Stop button because the updater is no longer running.
+        self.start_button.config(state=tk.NORMAL)
+        self.stop_button.config(state=tk.DISABLED)
+
+    # ---------------------------
+    # Networking methods
+    # ---------------------------
+    def _get_text(self, pool, url, timeout):
+        """
+        Sends a GET request to the given URL through the given connection pool and returns the
+        HTTP status code together with the short ASCII response body, so callers can tell an
+        error page apart from real data, and the IP address of the server that answered.
+        The connection is handed back to the pool immediately so it can be reused by the next request.
+        """
+        # preload_content=False lets us read the body ourselves and then release the connection explicitly.
+        resp = pool.request("GET", url, timeout=timeout, preload_content=False)
+        try:
+            # Find out which server address the connection is talking to ("peer" address).
+            # This must happen before the body is read, because urllib3 may detach the connection
+            # from the response as soon as the body has been read completely.
+            peer = None
+            sock = getattr(getattr(resp, "connection", None), "sock", None)
+            if sock is not None:
+                try:
+                    peer = sock.getpeername()[0]
+                except OSError:
+                    # The socket is no longer connected; the address is simply unknown.
+                    pass
+            # Read the whole (tiny) body and decode it as text. Any unexpected non-ASCII bytes
+            # (e.g. from an HTML error page) are replaced instead of raising an error.
+            return resp.status, resp.read().decode("ascii", "replace"), peer
+        finally:
+            # Always return the connection to the pool, even if reading the body failed.
+            resp.release_conn()
+
+    def _probe_ip(self, pool, timeout):
+        """
+        Looks up the current public IP address using the same connection pool.
+        Returns the address as a string, or None if the lookup failed or returned something else.
+        """
+        try:
+            # This is a tiny request and much cheaper than a full update.
+            # The server address of the lookup service is not needed, so it is ignored.
+            status, body, _ = self._get_text(pool, "https://api.ipify.org", timeout)
+        except Exception as e:
+            # Timeouts, connection errors and the like: report them, but don't stop the update.
+            self._logger.warning(f"IP lookup failed: {str(e)}")
+            return None
+        # Anything other than "200 OK" (e.g. a rate-limit or server error page) is not an IP address.
+        if status != 200:
+            self._logger.warning(f"IP lookup failed with HTTP {status}")
+            return None
+        ip = body.strip()
+        try:
+            # Make sure the body really is an IPv4 or IPv6 address before trusting it.
+            ipaddress.ip_address(ip)
+        except ValueError:
+            self._logger.warning("IP lookup did not return an IP address")
+            return None
+        return ip
+
+    def run_updater(self, subdomains, token, interval_minutes):
+        """
+        The function executed by the background thread. It continuously sends update requests
+        to the DuckDNS service at the specified interval until signaled to stop.
+        """
+        # Import the urllib3 library, a lightweight HTTP client with built-in connection pooling.
+        # For a single fixed GET request it does far less work per call than a higher-level library
+        # such as requests. It is imported here, not at the top of the file, so that loading it does
+        # not delay the window from appearing when the program starts. Python caches imported
+        # modules, so importing it again on later runs costs next to nothing.
+        try:
+            import urllib3
+        except ImportError as e:
+            # If urllib3 is missing, the updater cannot run. The windowed .exe has no console to show
+            # a traceback on, so report the problem in the log area instead.
+            self._logger.error(f"Cannot start updater: {str(e)}")
+            # Buttons belong to the GUI thread, so ask the main loop to reset them rather than
+            # changing them from this background thread.
+            self.master.after(0, self._reset_buttons)
+            return
+
+        # Create a connection pool so that successive updates reuse the same TCP/TLS connection
+        # (HTTP keep-alive) instead of performing a fresh handshake every interval. The pool belongs
+        # to this thread alone: only this thread uses it, and only this thread closes it when it exits,
+        # so a pool can never be closed while one of its requests is still in progress.
+        pool = urllib3.PoolManager(
+            # We only ever talk to two hosts (the public IP lookup service and DuckDNS itself),
+            # so one small pool is kept for each.
+            num_pools=2,
+            maxsize=2,
+            # Set the headers once here so every request made through the pool carries them.
+            headers={"Connection": "keep-alive", "User-Agent": "duckdns-updater/1.0"}
+        )
+
+        # On Windows, lower this thread's scheduling priority. The thread spends nearly all of its
+        # time waiting, and when it does briefly use the CPU it should never delay the GUI thread.
+        if sys.platform == "win32":
+            # ctypes lets Python call functions in Windows system libraries such as kernel32.dll.
+            import ctypes
+            k32 = ctypes.windll.kernel32
+            # -1 is THREAD_PRIORITY_BELOW_NORMAL; GetCurrentThread() refers to this updater thread.
+            k32.SetThreadPriority(k32.GetCurrentThread(), -1)
+
+        # Build the update URL for DuckDNS using the provided subdomains and token.
+        # The URL format follows the DuckDNS API specifications. DuckDNS accepts a comma-separated
+        # list of domains, so all subdomains are updated with a single request over one connection.
+        # The list is escaped with quote(), keeping the commas as they are. Since the subdomains and
+        # token never change while this thread runs, the URL is built once, outside the loop.
+        url = f"https://www.duckdns.org/update?domains={quote(','.join(subdomains), safe=',')}&token={token}&ip="
+
+        # Create separate connect and read timeouts. The 3.05 second connect timeout sits just past
+        # the 3 second TCP retransmission boundary, and the read timeouts make sure a server that stops
+        # responding cannot keep one of the few pooled connections busy forever.
+        probe_timeout = urllib3.Timeout(connect=3.05, read=5.0)
+        update_timeout = urllib3.Timeout(connect=3.05, read=10.0)
+
+        # Convert the update interval from minutes to seconds once.
+        interval_seconds = interval_minutes * 60.0
+
+        # Remember the address of the DuckDNS server behind the last successful update,
+        # so it can be written to the resolver cache.
+        duckdns_peer = None
+
+        # Continue running until the stop event flag is set.
+        while not self.stop_event.is_set():
+            # Work out when the next update is due. The deadline is measured from the start of this
+            # update, so the time the requests take does not push later updates back. time.monotonic()
+            # is a clock that never jumps, even if the system clock is changed (e.g. by time sync).
+            deadline = time.monotonic() + interval_seconds
+
+            # Look up the current public IP address. The lookup is only an optimization: if it fails,
+            # ip is None and the update is sent anyway, since DuckDNS detects the IP by itself.
+            ip = self._probe_ip(pool, probe_timeout)
+
+            if ip is not None and ip == self._last_ip:
+                # The IP has not changed since the last successful update, so skip it.
+                self._logger.info(f"IP unchanged ({ip}), skipping update.")
+            else:
+                try:
+                    # Send the GET request to the update URL through the connection pool.
+                    # DuckDNS replies with a short plain ASCII body such as "OK" or "KO".
+                    status, text, peer = self._get_text(pool, url, update_timeout)
+
+                    # Log the response text returned by DuckDNS (which may indicate success or failure).
+                    self._logger.info(f"Update sent. Response: {text}")
+
+                    # DuckDNS answers "OK" (with HTTP status 200) on success; only then remember the IP
+                    # as updated. If the lookup failed, this stores None, so the next update is not skipped.
+                    if status == 200 and text == "OK":
+                        self._last_ip = ip
+
+                        # After every successful update, store the address that the connection to
+                        # DuckDNS actually used on disk, with a fresh expiry time, so the next start
+                        # of the program can skip its DNS lookup.
+                        if peer is not None:
+                            duckdns_peer = peer
+                            save_resolver_cache(peer)
+                except Exception as e:
+                    # If any exception occurs during the HTTP request, log the error message.
+                    self._logger.error(f"Error during update: {str(e)}")
+                    # Don't write this address to the cache again when the thread exits.
+                    duckdns_peer = None
+                    # The cached address may be stale, so fall back to normal DNS lookups.
+                    drop_resolver_cache()
+            
+            # Wait until the deadline computed at the start of this iteration.
+            while not self.stop_event.is_set():
+                # Work out how much time is left using the monotonic clock.
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    # The deadline has passed: time for the next update.
+                    break
+                # Event.wait() blocks without waking up until either the timeout elapses or
+                # stop_updater() sets the event, so the thread exits promptly when asked to stop.
+                # Waiting at most 60 seconds at a time means the remaining time is rechecked regularly.
+                if self.stop_event.wait(timeout=min(remaining, 60.0)):
+                    # wait() returns True when the stop event was set.
+                    break
+        
+        # The loop has finished, so no request is in progress: clear the pool to release
+        # the pooled keep-alive connections.
+        pool.clear()
+
+        # While the IP is unchanged, updates are skipped, so the cache entry could expire during a
+        # long run. Refresh it one last time with the address of the last successful update.
+        if duckdns_peer is not None:
+            save_resolver_cache(duckdns_peer)
+
+        # When the while loop exits (i.e., when stop_event is set), log that the updater thread is exiting.
+        self._logger.info("Updater thread exiting.")
+
+
+# Define the main function which sets up and runs the Tkinter GUI application.
+def main():
+    # Use the cached DuckDNS address from a previous run, if it is still fresh.
+    load_resolver_cache()
+
+    # Create the main Tkinter window.
+    root = tk.Tk()
+    
+    # Instantiate the DuckDNSUpdater class with the main window as the master.
+    app = DuckDNSUpdater(root)
+    
+    # Start the Tkinter event loop. This loop listens for events such as button clicks,
+    # updates the GUI, and ensures that the application remains responsive.
+    root.mainloop()
+
+
+# The standard Python idiom to ensure that main() is only executed when this script is run directly,
+# and not when it is imported as a module in another script.
+if __name__ == '__main__':
+    main()
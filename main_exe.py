@@ -2,9 +2,99 @@ import tkinter as tk
 from tkinter import scrolledtext
 import threading
 import time
-import requests
-from datetime import datetime
+import json
+import ipaddress
+import os
+import socket
+import sys
+import logging
+import logging.handlers
 import queue
+from urllib.parse import quote
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the timestamp string for records logged within the same second."""
+    def __init__(self, fmt, datefmt):
+        super().__init__(fmt, datefmt)
+        self._cached_second = None
+        self._cached_time = ""
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_second = second
+            self._cached_time = time.strftime(self.datefmt, time.localtime(second))
+        return self._cached_time
+
+class _NotifyingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that wakes the Tk main loop with a virtual event after each queued record."""
+    def __init__(self, log_queue, widget):
+        super().__init__(log_queue)
+        self.widget = widget
+
+    def handle(self, record):
+        # Notify only after Handler.handle has released the handler lock: from a worker thread,
+        # event_generate blocks until the main loop runs it, and the main thread may be waiting
+        # on that same lock to log something itself
+        rv = super().handle(record)
+        if rv:
+            try:
+                self.widget.event_generate("<<LogReady>>", when="tail")
+            except (tk.TclError, RuntimeError):
+                # The window is gone or not yet in its main loop; the heartbeat will pick it up
+                pass
+        return rv
+
+# On-disk cache of the DuckDNS address, so a fresh process can skip its first DNS lookup
+_DUCKDNS_HOST = "www.duckdns.org"
+_RESOLVER_TTL = 3600
+# Only cached under %APPDATA%; without it (non-Windows) the cache is simply not used
+_RESOLVER_CACHE = os.path.join(os.environ["APPDATA"], "duckdns", "resolver.json") if os.environ.get("APPDATA") else None
+_original_getaddrinfo = socket.getaddrinfo
+
+def _cached_getaddrinfo_for(ip, expires):
+    """Return a getaddrinfo replacement that resolves the DuckDNS host to the cached address until it expires."""
+    def getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+        if host == _DUCKDNS_HOST and time.time() < expires:
+            return _original_getaddrinfo(ip, port, family, type, proto, flags | socket.AI_NUMERICHOST)
+        return _original_getaddrinfo(host, port, family, type, proto, flags)
+    return getaddrinfo
+
+def load_resolver_cache():
+    """Serve the DuckDNS host from the on-disk cache if the entry is still fresh."""
+    if _RESOLVER_CACHE is None:
+        return
+    try:
+        with open(_RESOLVER_CACHE) as f:
+            entry = json.load(f)
+        expires = float(entry["expires"])
+        if entry["host"] != _DUCKDNS_HOST or expires <= time.time():
+            return
+        ip = entry["ip"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return
+    socket.getaddrinfo = _cached_getaddrinfo_for(ip, expires)
+
+def save_resolver_cache(ip):
+    """Store the address the DuckDNS connection used on disk, with a fresh expiry, for the next start."""
+    if _RESOLVER_CACHE is None:
+        return
+    try:
+        os.makedirs(os.path.dirname(_RESOLVER_CACHE), exist_ok=True)
+        with open(_RESOLVER_CACHE, "w") as f:
+            json.dump({"host": _DUCKDNS_HOST, "ip": ip, "expires": time.time() + _RESOLVER_TTL}, f)
+    except OSError:
+        pass
+
+def drop_resolver_cache():
+    """Stop using the cached address and remove it, e.g. after a failed DuckDNS request."""
+    socket.getaddrinfo = _original_getaddrinfo
+    if _RESOLVER_CACHE is None:
+        return
+    try:
+        os.remove(_RESOLVER_CACHE)
+    except OSError:
+        pass
 
 class DuckDNSUpdater:
     def __init__(self, master):
@@ -12,16 +102,22 @@ class DuckDNSUpdater:
         self.master.title("DuckDNS Updater")
 
         # Create input fields and labels
-        tk.Label(master, text="DuckDNS Subdomain:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
-        self.subdomain_entry = tk.Entry(master, width=30)
+        tk.Label(master, text="DuckDNS Subdomain(s):").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
+        self.subdomain_var = tk.StringVar(master)
+        self.subdomain_entry = tk.Entry(master, width=30, textvariable=self.subdomain_var)
         self.subdomain_entry.grid(row=0, column=1, padx=5, pady=5)
 
         tk.Label(master, text="DuckDNS Token:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
-        self.token_entry = tk.Entry(master, width=30, show="*")
+        self.token_var = tk.StringVar(master)
+        self.token_entry = tk.Entry(master, width=30, show="*", textvariable=self.token_var)
         self.token_entry.grid(row=1, column=1, padx=5, pady=5)
 
         tk.Label(master, text="Update Interval (minutes):").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
-        self.interval_entry = tk.Entry(master, width=30)
+        # Only let digits and a single decimal point be typed into the interval field
+        vcmd = (master.register(self._is_interval_text), "%P")
+        self.interval_var = tk.StringVar(master)
+        self.interval_entry = tk.Entry(master, width=30, textvariable=self.interval_var,
+                                       validate="key", validatecommand=vcmd)
         self.interval_entry.grid(row=2, column=1, padx=5, pady=5)
 
         # Create Start and Stop buttons
@@ -39,79 +135,186 @@ class DuckDNSUpdater:
         self.updater_thread = None
         self.stop_event = threading.Event()
 
-        # Use a thread-safe queue for logging from background threads
-        self.log_queue = queue.Queue()
-        self.master.after(100, self.process_log_queue)
+        # Public IP last accepted by DuckDNS; updates are skipped while it is unchanged
+        self._last_ip = None
 
-    def log(self, message):
-        """Add a timestamped message to the log queue."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.log_queue.put(f"[{timestamp}] {message}\n")
+        # Route log records from background threads through a thread-safe queue
+        self.log_queue = queue.Queue()
+        self._qh = _NotifyingQueueHandler(self.log_queue, self.master)
+        self._logger = logging.getLogger("duckdns")
+        self._logger.addHandler(self._qh)
+        self._logger.setLevel(logging.INFO)
+        self._logger.propagate = False
+        self._formatter = _CachedTimeFormatter("[%(asctime)s] %(message)s", "%Y-%m-%d %H:%M:%S")
+        # Render records as soon as they are queued; a slow heartbeat covers missed events
+        self.master.bind("<<LogReady>>", lambda e: self.process_log_queue())
+        self._heartbeat_id = self.master.after(1000, self.process_log_queue)
 
     def process_log_queue(self):
-        """Periodically update the log widget with messages from the queue."""
+        """Render queued log records; runs on <<LogReady>> and on a 1 s heartbeat."""
+        self.master.after_cancel(self._heartbeat_id)
+        # Bind the bound methods used per record to locals to keep the drain loop tight
+        get = self.log_queue.get_nowait
+        fmt = self._formatter.format
+        lines = []
+        append = lines.append
         try:
             while True:
-                line = self.log_queue.get_nowait()
-                self.log_text.configure(state='normal')
-                self.log_text.insert(tk.END, line)
-                self.log_text.configure(state='disabled')
-                self.log_text.yview(tk.END)
+                append(fmt(get()) + "\n")
         except queue.Empty:
             pass
-        self.master.after(100, self.process_log_queue)
+        if lines:
+            # Insert the whole batch in one go rather than one Tk call per message
+            log_text = self.log_text
+            END = tk.END
+            log_text.configure(state='normal')
+            log_text.insert(END, "".join(lines))
+            log_text.configure(state='disabled')
+            log_text.yview(END)
+        self._heartbeat_id = self.master.after(1000, self.process_log_queue)
+
+    @staticmethod
+    def _is_interval_text(text):
+        """Entry validatecommand: accept an empty field or digits with at most one decimal point."""
+        return text == "" or text.replace(".", "", 1).isdecimal()
 
     def start_updater(self):
         """Start the updater thread after validating input."""
-        subdomain = self.subdomain_entry.get().strip()
-        token = self.token_entry.get().strip()
-        try:
-            interval_minutes = float(self.interval_entry.get().strip())
-        except ValueError:
-            self.log("Invalid interval. Please enter a numeric value.")
+        # Several subdomains may be given, separated by commas; they are updated in one request
+        subdomains = [s.strip() for s in self.subdomain_var.get().split(",") if s.strip()]
+        token = self.token_var.get().strip()
+        text = self.interval_var.get().strip()
+        interval_minutes = float(text) if text else 0.0
+        # A zero interval would re-run the updater back to back with no wait at all
+        if interval_minutes <= 0:
+            self._logger.info("Invalid interval. Interval must be greater than zero.")
             return
 
-        if not subdomain or not token:
-            self.log("Both subdomain and token are required!")
+        if not subdomains or not token:
+            self._logger.info("Both subdomain and token are required!")
             return
 
         self.stop_event.clear()
+        self._last_ip = None
         self.start_button.config(state=tk.DISABLED)
         self.stop_button.config(state=tk.NORMAL)
         self.updater_thread = threading.Thread(
             target=self.run_updater,
-            args=(subdomain, token, interval_minutes),
+            args=(subdomains, token, interval_minutes),
             daemon=True
         )
         self.updater_thread.start()
-        self.log("Updater started.")
+        self._logger.info("Updater started.")
 
     def stop_updater(self):
         """Signal the updater thread to stop."""
         self.stop_event.set()
+        self._reset_buttons()
+        self._logger.info("Updater stopped.")
+
+    def _reset_buttons(self):
+        """Re-enable Start and disable Stop once the updater is no longer running."""
         self.start_button.config(state=tk.NORMAL)
         self.stop_button.config(state=tk.DISABLED)
-        self.log("Updater stopped.")
 
-    def run_updater(self, subdomain, token, interval_minutes):
+    def _get_text(self, pool, url, timeout):
+        """GET url and return (status, short text body, peer IP), handing the connection back to the pool at once."""
+        resp = pool.request("GET", url, timeout=timeout, preload_content=False)
+        try:
+            # Read the peer before the body: urllib3 may detach the connection once it is fully read
+            peer = None
+            sock = getattr(getattr(resp, "connection", None), "sock", None)
+            if sock is not None:
+                try:
+                    peer = sock.getpeername()[0]
+                except OSError:
+                    pass
+            return resp.status, resp.read().decode("ascii", "replace"), peer
+        finally:
+            resp.release_conn()
+
+    def _probe_ip(self, pool, timeout):
+        """Return the current public IP, or None if the lookup fails or returns something else."""
+        try:
+            status, body, _ = self._get_text(pool, "https://api.ipify.org", timeout)
+        except Exception as e:
+            self._logger.warning(f"IP lookup failed: {str(e)}")
+            return None
+        if status != 200:
+            self._logger.warning(f"IP lookup failed with HTTP {status}")
+            return None
+        ip = body.strip()
+        try:
+            ipaddress.ip_address(ip)
+        except ValueError:
+            self._logger.warning("IP lookup did not return an IP address")
+            return None
+        return ip
+
+    def run_updater(self, subdomains, token, interval_minutes):
         """Background thread: periodically sends the update request."""
+        # Imported here rather than at module level so the window appears before urllib3 is loaded
+        try:
+            import urllib3
+        except ImportError as e:
+            # A windowed .exe has no console, so report through the log and restore the buttons
+            self._logger.error(f"Cannot start updater: {str(e)}")
+            self.master.after(0, self._reset_buttons)
+            return
+        # Keep-alive HTTPS pool (IP probe + DuckDNS), owned by this thread and cleared when it exits
+        pool = urllib3.PoolManager(
+            num_pools=2,
+            maxsize=2,
+            headers={"Connection": "keep-alive", "User-Agent": "duckdns-updater/1.0"}
+        )
+        if sys.platform == "win32":
+            # Keep the mostly idle network thread from preempting the GUI thread
+            import ctypes
+            k32 = ctypes.windll.kernel32
+            k32.SetThreadPriority(k32.GetCurrentThread(), -1)  # THREAD_PRIORITY_BELOW_NORMAL
+        # The URL never changes for the life of the thread, so build it once
+        url = f"https://www.duckdns.org/update?domains={quote(','.join(subdomains), safe=',')}&token={token}&ip="
+        # Connect just past the 3 s TCP retransmit boundary; bound reads so a hung peer frees its slot
+        probe_timeout = urllib3.Timeout(connect=3.05, read=5.0)
+        update_timeout = urllib3.Timeout(connect=3.05, read=10.0)
+        interval_seconds = interval_minutes * 60.0
+        # Address of the DuckDNS server behind the last successful update, for the resolver cache
+        duckdns_peer = None
         while not self.stop_event.is_set():
-            try:
-                # Construct the DuckDNS update URL
-                url = f"https://www.duckdns.org/update?domains={subdomain}&token={token}&ip="
-                response = requests.get(url)
-                self.log(f"Update sent. Response: {response.text}")
-            except Exception as e:
-                self.log(f"Error during update: {str(e)}")
-            # Wait for the specified interval; check for stop signal every second
-            total_seconds = interval_minutes * 60
-            for _ in range(int(total_seconds)):
-                if self.stop_event.is_set():
+            # Schedule on the monotonic clock, start to start, so request time and clock jumps don't drift it
+            deadline = time.monotonic() + interval_seconds
+            # The probe is only an optimization: if it fails, update anyway (DuckDNS detects the IP itself)
+            ip = self._probe_ip(pool, probe_timeout)
+            if ip is not None and ip == self._last_ip:
+                self._logger.info(f"IP unchanged ({ip}), skipping update.")
+            else:
+                try:
+                    status, text, peer = self._get_text(pool, url, update_timeout)
+                    self._logger.info(f"Update sent. Response: {text}")
+                    if status == 200 and text == "OK":
+                        self._last_ip = ip
+                        if peer is not None:
+                            duckdns_peer = peer
+                            save_resolver_cache(peer)
+                except Exception as e:
+                    self._logger.error(f"Error during update: {str(e)}")
+                    duckdns_peer = None
+                    drop_resolver_cache()
+            # Wait until the deadline; returns early as soon as stop is signalled
+            while not self.stop_event.is_set():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                if self.stop_event.wait(timeout=min(remaining, 60.0)):
                     break
-                time.sleep(1)
-        self.log("Updater thread exiting.")
+        pool.clear()
+        # Updates are skipped while the IP is unchanged, so refresh the entry's expiry on the way out
+        if duckdns_peer is not None:
+            save_resolver_cache(duckdns_peer)
+        self._logger.info("Updater thread exiting.")
 
 def main():
+    load_resolver_cache()
     root = tk.Tk()
     app = DuckDNSUpdater(root)
     root.mainloop()